@@ -4,9 +4,12 @@ Azure DevOps Sprint Dashboard - Main Streamlit Application
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
+import hashlib
+import html
 import os
-from typing import Optional
+import uuid
+from typing import Dict, List, Optional, Tuple
 
 # Import custom modules
 from azure_devops_client import AzureDevOpsClient
@@ -15,15 +18,351 @@ from visualizations import DashboardVisualizations
 from config import DASHBOARD_CONFIG, AZURE_DEVOPS_CONFIG
 
 
+class _EmptyResponseError(Exception):
+    """
+    Raised by the cached fetchers when Azure DevOps returns nothing
+    
+    AzureDevOpsClient reports request failures itself and returns an empty result, so raising
+    here is what keeps st.cache_data from storing (and replaying) a failed or empty response.
+    """
+
+
+def _hash_pat(pat: str) -> str:
+    """Return a stable, non-reversible cache key for a Personal Access Token"""
+    return hashlib.sha256(pat.encode()).hexdigest()
+
+
+def _store_pat_hash():
+    """Hash the Personal Access Token into session state whenever it is edited"""
+    pat = st.session_state.pat
+    st.session_state.pat_hash = _hash_pat(pat) if pat else None
+
+
+def _build_client_config(organization: str, project: str, team: str) -> Dict:
+    """
+    Build an Azure DevOps client configuration for the given settings
+    
+    Args:
+        organization: Azure DevOps organization name
+        project: Azure DevOps project name
+        team: Azure DevOps team name
+        
+    Returns:
+        Client configuration dictionary
+    """
+    return {
+        'organization': organization,
+        'project': project,
+        'team': team,
+        'base_url': AZURE_DEVOPS_CONFIG['base_url'],
+        'api_version': AZURE_DEVOPS_CONFIG['api_version']
+    }
+
+
+def _current_iteration_index(iterations: List[Dict]) -> Optional[int]:
+    """
+    Find the iteration whose date range contains the current date
+    
+    Args:
+        iterations: List of iteration dictionaries
+        
+    Returns:
+        Index of the current iteration, or None if no iteration is active
+    """
+    current_date = datetime.now(timezone.utc)
+    
+    for i, iteration in enumerate(iterations):
+        attributes = iteration.get('attributes', {})
+        if not attributes.get('startDate') or not attributes.get('finishDate'):
+            continue
+        
+        start_date = datetime.fromisoformat(attributes['startDate'].replace('Z', '+00:00'))
+        finish_date = datetime.fromisoformat(attributes['finishDate'].replace('Z', '+00:00'))
+        
+        if start_date <= current_date <= finish_date:
+            return i
+    
+    return None
+
+
+# Clients hold the raw PAT and an open HTTP session, so stale ones are evicted
+@st.cache_resource(ttl=3600, max_entries=16, show_spinner=False)
+def _get_client(pat_hash: str, client_config: Dict, _pat: str) -> AzureDevOpsClient:
+    """
+    Get a shared Azure DevOps client so its HTTP session and connection pool are reused
+    
+    Args:
+        pat_hash: Hash of the Personal Access Token (used as cache key)
+        client_config: Client configuration dictionary
+        _pat: Raw Personal Access Token (not hashed by Streamlit)
+        
+    Returns:
+        Configured AzureDevOpsClient instance
+    """
+    client = AzureDevOpsClient(_pat)
+    client.config = client_config
+    return client
+
+
+@st.cache_resource(show_spinner=False)
+def _get_viz() -> DashboardVisualizations:
+    """
+    Get the shared visualizations instance instead of rebuilding it every rerun
+    
+    Returns:
+        DashboardVisualizations instance
+    """
+    return DashboardVisualizations()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _test_connection(pat_hash: str, client_config: Dict, _pat: str) -> bool:
+    """
+    Test the Azure DevOps connection, cached per PAT and configuration
+    
+    Args:
+        pat_hash: Hash of the Personal Access Token (used as cache key)
+        client_config: Client configuration dictionary
+        _pat: Raw Personal Access Token (not hashed by Streamlit)
+        
+    Returns:
+        True if connection is successful
+        
+    Raises:
+        _EmptyResponseError: If the connection failed, so the failure is not cached
+    """
+    client = _get_client(pat_hash, client_config, _pat)
+    if not client.test_connection():
+        raise _EmptyResponseError("Connection test failed")
+    return True
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_iterations(pat_hash: str, client_config: Dict, _pat: str) -> List[Dict]:
+    """
+    Fetch the team's iterations, cached per PAT and organization/project/team
+    
+    Args:
+        pat_hash: Hash of the Personal Access Token (used as cache key)
+        client_config: Client configuration dictionary
+        _pat: Raw Personal Access Token (not hashed by Streamlit)
+        
+    Returns:
+        List of iteration dictionaries
+        
+    Raises:
+        _EmptyResponseError: If no iterations were returned, so the result is not cached
+    """
+    client = _get_client(pat_hash, client_config, _pat)
+    iterations = client.get_iterations()
+    if not iterations:
+        raise _EmptyResponseError("No iterations returned")
+    return iterations
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_area_paths(pat_hash: str, client_config: Dict, root_area_path: str, _pat: str) -> List[str]:
+    """
+    Fetch the area paths under a root, cached per PAT and organization/project/team
+    
+    Args:
+        pat_hash: Hash of the Personal Access Token (used as cache key)
+        client_config: Client configuration dictionary
+        root_area_path: Root area path to search under
+        _pat: Raw Personal Access Token (not hashed by Streamlit)
+        
+    Returns:
+        List of area path strings
+        
+    Raises:
+        _EmptyResponseError: If no area paths were returned, so the result is not cached
+    """
+    client = _get_client(pat_hash, client_config, _pat)
+    area_paths = client.get_area_paths(root_area_path)
+    if not area_paths:
+        raise _EmptyResponseError("No area paths returned")
+    return area_paths
+
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def _fetch_work_items(pat_hash: str, client_config: Dict, iteration_path: str,
+                      area_path: str, _pat: str) -> Tuple[List[Dict], datetime]:
+    """
+    Fetch work items for an iteration, cached per PAT, configuration and paths
+    
+    Args:
+        pat_hash: Hash of the Personal Access Token (used as cache key)
+        client_config: Client configuration dictionary
+        iteration_path: Path of the iteration
+        area_path: Area path to filter work items
+        _pat: Raw Personal Access Token (not hashed by Streamlit)
+        
+    Returns:
+        Tuple of (work item dictionaries, time they were fetched from Azure DevOps)
+        
+    Raises:
+        _EmptyResponseError: If no work items were returned, so the result is not cached
+    """
+    client = _get_client(pat_hash, client_config, _pat)
+    work_items = client.get_work_items_by_iteration(iteration_path, area_path)
+    if not work_items:
+        raise _EmptyResponseError("No work items returned")
+    return work_items, datetime.now()
+
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _csv_bytes(data_key: str, _df: pd.DataFrame) -> bytes:
+    """
+    Serialize the work items DataFrame to CSV once per data load
+    
+    Args:
+        data_key: Token identifying one data load
+        _df: DataFrame to serialize (not hashed by Streamlit)
+        
+    Returns:
+        CSV content as UTF-8 bytes
+    """
+    return _df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _cached_figure(data_key: str, chart: str, _viz: DashboardVisualizations, _data):
+    """
+    Build a Plotly figure once per data load and reuse it across reruns
+    
+    Args:
+        data_key: Token identifying one data load
+        chart: Name of the DashboardVisualizations chart factory
+        _viz: Visualizations instance (not hashed by Streamlit)
+        _data: Chart input data (not hashed by Streamlit)
+        
+    Returns:
+        Plotly figure object
+    """
+    return getattr(_viz, chart)(_data)
+
+
+# Rows per page in the Raw Data table
+RAW_DATA_PAGE_SIZE = 100
+
+# Sprint Overview banner with gradient background
+OVERVIEW_HEADER_HTML = """
+<div style="
+    background: linear-gradient(90deg, #A8DADC 0%, #F1FAEE 100%);
+    padding: 20px;
+    border-radius: 10px;
+    margin-bottom: 20px;
+    text-align: center;
+">
+    <h1 style="color: #2E2E2E; margin: 0; font-size: 2.5em;">📈 Sprint Overview</h1>
+    <p style="color: #6C757D; margin: 5px 0 0 0; font-size: 1.1em;">Comprehensive sprint analytics and insights</p>
+</div>
+"""
+
+# Sprint Champion header card, formatted with the champion's name and score
+CHAMPION_CARD_HTML = """
+<div style="
+    background: linear-gradient(135deg, #FFD700 0%, #FFA500 100%);
+    padding: 20px;
+    border-radius: 10px;
+    margin-bottom: 20px;
+    text-align: center;
+    border: 2px solid #FFD700;
+">
+    <h2 style="color: #2E2E2E; margin: 0; font-size: 2em;">🥇 {assignee}</h2>
+    <p style="color: #4A4A4A; margin: 5px 0 0 0; font-size: 1.2em; font-weight: bold;">Sprint Champion - Score: {score:.1f} points</p>
+</div>
+"""
+
+# Column configuration for the team workload table
+WORKLOAD_COLUMN_CONFIG = {
+    "assigned_to": st.column_config.TextColumn("Assignee", width="medium"),
+    "total_items": st.column_config.NumberColumn("Total Items", width="small"),
+    "story_points": st.column_config.NumberColumn("Story Points", width="small"),
+    "completed_items": st.column_config.NumberColumn("Completed", width="small"),
+    "completed_story_points": st.column_config.NumberColumn("Completed SP", width="small"),
+    "completion_rate": st.column_config.NumberColumn("Completion %", width="small", format="%.1f%%")
+}
+
+# Column configuration for the cycle time details table
+CYCLE_TIME_COLUMN_CONFIG = {
+    "work_item_type": st.column_config.TextColumn("Work Item Type", width="medium"),
+    "count": st.column_config.NumberColumn("Count", width="small"),
+    "avg_cycle_time": st.column_config.NumberColumn("Avg Days", width="small", format="%.1f"),
+    "median_cycle_time": st.column_config.NumberColumn("Median Days", width="small", format="%.1f"),
+    "min_cycle_time": st.column_config.NumberColumn("Min Days", width="small"),
+    "max_cycle_time": st.column_config.NumberColumn("Max Days", width="small")
+}
+
+# Column configuration for the important work achievement tables
+ACHIEVEMENT_COLUMN_CONFIG = {
+    "title": st.column_config.TextColumn("Work Item", width="large"),
+    "work_item_type": st.column_config.TextColumn("Type", width="small"),
+    "assigned_to": st.column_config.TextColumn("Assignee", width="medium"),
+    "story_points": st.column_config.NumberColumn("SP", width="small")
+}
+
+# Column configuration for the sprint champion's recent work table
+CHAMPION_WORK_COLUMN_CONFIG = {
+    "title": st.column_config.TextColumn("Work Item", width="large"),
+    "work_item_type": st.column_config.TextColumn("Type", width="small"),
+    "story_points": st.column_config.NumberColumn("SP", width="small")
+}
+
+# Column configuration for the top contributors leaderboard
+LEADERBOARD_COLUMN_CONFIG = {
+    "🏆": st.column_config.NumberColumn("Rank", width="small"),
+    "Name": st.column_config.TextColumn("Contributor", width="medium"),
+    "Score": st.column_config.TextColumn("Score", width="small"),
+    "Completion": st.column_config.TextColumn("Completion", width="small"),
+    "Story Points": st.column_config.TextColumn("Completed SP", width="small"),
+    "High Priority": st.column_config.NumberColumn("Priority Items", width="small")
+}
+
+# SprintAnalyzer getters precomputed for the dashboard tabs
+ANALYZER_METRICS = [
+    'get_sprint_summary',
+    'get_velocity_data',
+    'get_daily_progress',
+    'get_work_item_type_distribution',
+    'get_priority_distribution',
+    'get_assignee_workload',
+    'get_cycle_time_analysis',
+    'get_blocked_items',
+    'get_important_work_analysis',
+    'get_sprint_champion_analysis'
+]
+
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _compute_sprint_metrics(data_key: str, _analyzer: SprintAnalyzer) -> Dict:
+    """
+    Run all SprintAnalyzer metrics once per data load
+    
+    Args:
+        data_key: Token identifying one data load
+        _analyzer: Analyzer holding the work items (not hashed by Streamlit)
+        
+    Returns:
+        Dictionary mapping analyzer getter name to its result
+    """
+    return {metric: getattr(_analyzer, metric)() for metric in ANALYZER_METRICS}
+
+
 class SprintDashboard:
     """Main dashboard application class"""
     
     def __init__(self):
         """Initialize the dashboard"""
         self.setup_page_config()
-        self.viz = DashboardVisualizations()
+        self.viz = _get_viz()
         self.client = None
-        self.analyzer = None
+        # Restore the analyzer loaded on an earlier run so section switches keep the data
+        self.analyzer = st.session_state.get('analyzer')
+        self.data_key = st.session_state.get('data_key')
+        self.fetched_at = st.session_state.get('data_fetched_at')
+        self.metrics = {}
+        self.summary_data = {}
     
     def setup_page_config(self):
         """Configure Streamlit page settings"""
@@ -45,10 +384,14 @@ class SprintDashboard:
         
         # Authentication Section
         st.sidebar.subheader("🔐 Authentication")
+        if 'pat_hash' not in st.session_state:
+            st.session_state.pat_hash = None
         pat = st.sidebar.text_input(
             "Personal Access Token",
             type="password",
-            help="Enter your Azure DevOps Personal Access Token"
+            help="Enter your Azure DevOps Personal Access Token",
+            key="pat",
+            on_change=_store_pat_hash
         )
         
         # Azure DevOps Settings Section
@@ -75,24 +418,18 @@ class SprintDashboard:
             help="Azure DevOps team name"
         )
         
+        # Client configuration and PAT cache key shared by the sidebar actions
+        client_config = _build_client_config(organization, project, team)
+        pat_hash = st.session_state.pat_hash
+        
         # Test connection button
         if pat and st.sidebar.button("🔍 Test Connection"):
             with st.spinner("Testing connection..."):
-                # Create temporary config for testing
-                temp_config = {
-                    'organization': organization,
-                    'project': project,
-                    'team': team,
-                    'base_url': AZURE_DEVOPS_CONFIG['base_url'],
-                    'api_version': AZURE_DEVOPS_CONFIG['api_version']
-                }
-                test_client = AzureDevOpsClient(pat)
-                test_client.config = temp_config
-                
-                if test_client.test_connection():
+                try:
+                    _test_connection(pat_hash, client_config, pat)
                     st.sidebar.success("✅ Connection successful!")
                     st.session_state.connection_tested = True
-                else:
+                except _EmptyResponseError:
                     st.sidebar.error("❌ Connection failed. Please check your settings.")
                     st.session_state.connection_tested = False
         
@@ -102,6 +439,9 @@ class SprintDashboard:
         # Initialize session state for iterations and area paths if not exists
         if 'available_iterations' not in st.session_state:
             st.session_state.available_iterations = []
+            st.session_state.sprint_names = []
+            st.session_state.iterations_by_name = {}
+            st.session_state.current_sprint_index = None
         if 'available_area_paths' not in st.session_state:
             st.session_state.available_area_paths = []
         
@@ -114,22 +454,16 @@ class SprintDashboard:
                 if st.button("🔄 Load Sprints", use_container_width=True):
                     with st.spinner("Loading available sprints..."):
                         try:
-                            temp_config = {
-                                'organization': organization,
-                                'project': project,
-                                'team': team,
-                                'base_url': AZURE_DEVOPS_CONFIG['base_url'],
-                                'api_version': AZURE_DEVOPS_CONFIG['api_version']
-                            }
-                            temp_client = AzureDevOpsClient(pat)
-                            temp_client.config = temp_config
-                            iterations = temp_client.get_iterations()
+                            iterations = _fetch_iterations(pat_hash, client_config, pat)
                             
-                            if iterations:
-                                st.session_state.available_iterations = iterations
-                                st.sidebar.success(f"✅ Loaded {len(iterations)} sprints")
-                            else:
-                                st.sidebar.warning("No sprints found")
+                            st.session_state.available_iterations = iterations
+                            st.session_state.sprint_names = [iteration['name'] for iteration in iterations]
+                            st.session_state.iterations_by_name = {iteration['name']: iteration for iteration in iterations}
+                            # Dates are parsed once here rather than on every rerun
+                            st.session_state.current_sprint_index = _current_iteration_index(iterations)
+                            st.sidebar.success(f"✅ Loaded {len(iterations)} sprints")
+                        except _EmptyResponseError:
+                            st.sidebar.warning("No sprints found")
                         except Exception as e:
                             st.sidebar.error(f"Failed to load sprints: {str(e)}")
             
@@ -138,57 +472,28 @@ class SprintDashboard:
                 if st.button("📁 Load Areas", use_container_width=True):
                     with st.spinner("Loading area paths..."):
                         try:
-                            temp_config = {
-                                'organization': organization,
-                                'project': project,
-                                'team': team,
-                                'base_url': AZURE_DEVOPS_CONFIG['base_url'],
-                                'api_version': AZURE_DEVOPS_CONFIG['api_version']
-                            }
-                            temp_client = AzureDevOpsClient(pat)
-                            temp_client.config = temp_config
-                            area_paths = temp_client.get_area_paths("TaxProf")
+                            area_paths = _fetch_area_paths(pat_hash, client_config, "TaxProf", pat)
                             
-                            if area_paths:
-                                st.session_state.available_area_paths = area_paths
-                                st.sidebar.success(f"✅ Loaded {len(area_paths)} area paths")
-                            else:
-                                st.sidebar.warning("No area paths found under TaxProf")
+                            st.session_state.available_area_paths = area_paths
+                            st.sidebar.success(f"✅ Loaded {len(area_paths)} area paths")
+                        except _EmptyResponseError:
+                            st.sidebar.warning("No area paths found under TaxProf")
                         except Exception as e:
                             st.sidebar.error(f"Failed to load area paths: {str(e)}")
         
-        # Sprint dropdown - show all available sprints
-        sprint_options = ["Select a sprint..."]
-        default_sprint_index = 0
-        
-        if st.session_state.available_iterations:
-            # Show all sprints (no filtering)
-            all_iterations = st.session_state.available_iterations
-            sprint_options.extend([iteration['name'] for iteration in all_iterations])
-            
-            # Find current sprint and set as default
-            from datetime import timezone
-            current_date = datetime.now(timezone.utc)
-            
-            for i, iteration in enumerate(all_iterations):
-                start_date = datetime.fromisoformat(iteration['attributes']['startDate'].replace('Z', '+00:00'))
-                finish_date = datetime.fromisoformat(iteration['attributes']['finishDate'].replace('Z', '+00:00'))
-                
-                if start_date <= current_date <= finish_date:
-                    default_sprint_index = i + 1  # +1 because of "Select a sprint..." at index 0
-                    break
-            
-            # Update session state to include all iterations for later use
-            st.session_state.filtered_iterations = all_iterations
+        # Sprint dropdown - show all available sprints, with the current sprint (found when
+        # sprints were loaded) as the default
+        sprint_options = st.session_state.sprint_names
         
         # Sprint selection
         use_dropdown = st.sidebar.checkbox("Use dropdown selection", value=True, help="Uncheck to manually enter sprint name")
         
-        if use_dropdown and sprint_options and len(sprint_options) > 1:
+        if use_dropdown and sprint_options:
             selected_sprint = st.sidebar.selectbox(
                 "Select Sprint",
                 options=sprint_options,
-                index=default_sprint_index,
+                index=st.session_state.current_sprint_index,
+                placeholder="Select a sprint...",
                 help="Select the sprint to analyze (current sprint selected by default)"
             )
         else:
@@ -199,32 +504,28 @@ class SprintDashboard:
                 help="Enter the exact sprint name or iteration path"
             )
             
-            if sprint_options and len(sprint_options) > 1:
+            if sprint_options:
                 with st.sidebar.expander("📋 Available Sprints", expanded=False):
-                    for sprint in sprint_options[1:]:
-                        st.write(f"• {sprint}")
+                    st.markdown("  \n".join(f"• {sprint}" for sprint in sprint_options))
         
         # Area Path selection
         use_area_dropdown = st.sidebar.checkbox("Use area path dropdown", value=True, help="Uncheck to manually enter area path")
         
-        area_path_options = ["Select an area path..."]
-        default_area_index = 0
+        area_path_options = st.session_state.available_area_paths
+        default_area_index = None
         
-        if st.session_state.available_area_paths:
-            area_path_options.extend(st.session_state.available_area_paths)
-            default_area_path = "TaxProf\\us\\taxAuto\\ADGE\\Prep"
-            if default_area_path in st.session_state.available_area_paths:
-                default_area_index = st.session_state.available_area_paths.index(default_area_path) + 1
+        default_area_path = "TaxProf\\us\\taxAuto\\ADGE\\Prep"
+        if default_area_path in area_path_options:
+            default_area_index = area_path_options.index(default_area_path)
         
-        if use_area_dropdown and area_path_options and len(area_path_options) > 1:
+        if use_area_dropdown and area_path_options:
             area_path = st.sidebar.selectbox(
                 "Select Area Path",
                 options=area_path_options,
                 index=default_area_index,
+                placeholder="Select an area path...",
                 help="Select the area path to filter work items"
             )
-            if area_path == "Select an area path...":
-                area_path = ""
         else:
             area_path = st.sidebar.text_input(
                 "Area Path",
@@ -233,20 +534,31 @@ class SprintDashboard:
                 help="Enter the area path to filter work items"
             )
             
-            if area_path_options and len(area_path_options) > 1:
+            if area_path_options:
                 with st.sidebar.expander("📁 Available Area Paths", expanded=False):
-                    for path in area_path_options[1:]:
-                        st.write(f"• {path}")
+                    st.markdown("  \n".join(f"• {path}" for path in area_path_options))
         
         # Fetch Data button
-        fetch_data_disabled = (
-            not pat or not organization or not project or not team or 
-            selected_sprint == "Select a sprint..." or not selected_sprint or not area_path
-        )
+        fetch_data_disabled = not all([pat, organization, project, team, selected_sprint, area_path])
         
         if st.sidebar.button("📥 Fetch Data", disabled=fetch_data_disabled):
             st.session_state.fetch_data_clicked = True
         
+        # Refresh Data button - bypass cached API responses and reload the current selection
+        if st.session_state.get('data_loaded') and st.sidebar.button(
+            "♻️ Refresh Data",
+            disabled=fetch_data_disabled,
+            help="Fetch the latest work items from Azure DevOps instead of cached results"
+        ):
+            # Only drop this user's cached responses for the current selection; other sessions keep theirs.
+            # Sprints missing from the loaded list are fetched by name, as in load_data_with_config
+            iteration_path = st.session_state.iterations_by_name.get(selected_sprint, {}).get('path', selected_sprint)
+            _fetch_work_items.clear(pat_hash, client_config, iteration_path, area_path, pat)
+            _fetch_iterations.clear(pat_hash, client_config, pat)
+            _fetch_area_paths.clear(pat_hash, client_config, "TaxProf", pat)
+            st.session_state.current_config = None
+            st.session_state.fetch_data_clicked = True
+        
         # Instructions
         with st.sidebar.expander("📖 Instructions", expanded=False):
             st.markdown("""
@@ -301,26 +613,13 @@ class SprintDashboard:
         """
         try:
             # Create client config
-            client_config = {
-                'organization': config['organization'],
-                'project': config['project'],
-                'team': config['team'],
-                'base_url': AZURE_DEVOPS_CONFIG['base_url'],
-                'api_version': AZURE_DEVOPS_CONFIG['api_version']
-            }
+            client_config = _build_client_config(config['organization'], config['project'], config['team'])
             
             # Initialize client
-            self.client = AzureDevOpsClient(config['pat'])
-            self.client.config = client_config
+            self.client = _get_client(st.session_state.pat_hash, client_config, config['pat'])
             
             # Find selected iteration from all available sprints
-            selected_iteration = None
-            iterations_to_search = st.session_state.get('filtered_iterations', st.session_state.get('available_iterations', []))
-            
-            for iteration in iterations_to_search:
-                if iteration['name'] == config['selected_sprint']:
-                    selected_iteration = iteration
-                    break
+            selected_iteration = st.session_state.get('iterations_by_name', {}).get(config['selected_sprint'])
             
             # If not found in loaded iterations, try to use the sprint name directly
             if not selected_iteration:
@@ -339,14 +638,19 @@ class SprintDashboard:
             # Get work items for selected iteration
             with st.spinner("Fetching work items..."):
                 iteration_path = selected_iteration['path']
-                work_items = self.client.get_work_items_by_iteration(iteration_path, config['area_path'])
-                
-                if not work_items:
+                try:
+                    work_items, self.fetched_at = _fetch_work_items(
+                        st.session_state.pat_hash, client_config, iteration_path, config['area_path'], config['pat']
+                    )
+                except _EmptyResponseError:
                     st.warning("No work items found for the selected sprint and area path. Please verify the sprint name is correct.")
                     return False
             
             # Initialize analyzer
             self.analyzer = SprintAnalyzer(work_items, selected_iteration)
+            # The metric, figure and CSV caches are shared by every session, so each load gets
+            # its own token and a key is never reused for different data
+            self.data_key = uuid.uuid4().hex
             
             return True
             
@@ -354,27 +658,52 @@ class SprintDashboard:
             st.error(f"Error loading data: {str(e)}")
             return False
     
+    def get_analysis(self, metric: str):
+        """
+        Get a precomputed analyzer metric
+        
+        Args:
+            metric: Name of the SprintAnalyzer getter
+            
+        Returns:
+            Result of the analyzer getter
+        """
+        return self.metrics[metric]
+    
+    def get_figure(self, chart: str, data):
+        """
+        Get a chart figure through the per-sprint figure cache
+        
+        Args:
+            chart: Name of the DashboardVisualizations chart factory
+            data: Chart input data
+            
+        Returns:
+            Plotly figure object
+        """
+        return _cached_figure(self.data_key, chart, self.viz, data)
+    
     def display_sprint_overview(self):
         """Display enhanced sprint overview section with comprehensive analytics"""
+        summary_data = self.summary_data
+        
         # Beautiful header with gradient background effect
-        st.markdown("""
-        <div style="
-            background: linear-gradient(90deg, #A8DADC 0%, #F1FAEE 100%);
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            text-align: center;
-        ">
-            <h1 style="color: #2E2E2E; margin: 0; font-size: 2.5em;">📈 Sprint Overview</h1>
-            <p style="color: #6C757D; margin: 5px 0 0 0; font-size: 1.1em;">Comprehensive sprint analytics and insights</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(OVERVIEW_HEADER_HTML, unsafe_allow_html=True)
         
         # Get comprehensive sprint data
-        summary_data = self.analyzer.get_sprint_summary()
-        velocity_data = self.analyzer.get_velocity_data()
-        type_distribution = self.analyzer.get_work_item_type_distribution()
-        assignee_workload = self.analyzer.get_assignee_workload()
+        velocity_data = self.get_analysis('get_velocity_data')
+        type_distribution = self.get_analysis('get_work_item_type_distribution')
+        assignee_workload = self.get_analysis('get_assignee_workload')
+        
+        # Unpack the figures used throughout the overview once
+        total_items = summary_data.get('total_items', 0)
+        in_progress_items = summary_data.get('in_progress_items', 0)
+        total_completed_sp = summary_data.get('completed_story_points', 0)
+        completion_percentage = summary_data.get('completion_percentage', 0)
+        velocity_per_day = velocity_data.get('velocity_per_day', 0)
+        velocity_completion_rate = velocity_data.get('completion_rate', 0)
+        planned_sp = velocity_data.get('planned_story_points', 0)
+        completed_sp = velocity_data.get('completed_story_points', 0)
         
         # Display summary cards with beautiful styling
         st.markdown("### 📊 Sprint Metrics")
@@ -386,7 +715,7 @@ class SprintDashboard:
         
         # Display key sprint data prominently
         sprint_name = self.analyzer.iteration_info['name'] if self.analyzer.iteration_info else "Unknown Sprint"
-        total_work_items = len(self.analyzer.df) if self.analyzer and not self.analyzer.df.empty else 0
+        total_work_items = len(self.analyzer.df)
         area_path = st.session_state.get('current_config', {}).get('area_path', 'Not specified')
         
         st.markdown(f"""
@@ -403,10 +732,10 @@ class SprintDashboard:
         
         with col1:
             # Sprint dates and duration
-            if self.analyzer.iteration_info:
-                start_date = pd.to_datetime(self.analyzer.iteration_info['attributes']['startDate']).tz_localize(None)
-                end_date = pd.to_datetime(self.analyzer.iteration_info['attributes']['finishDate']).tz_localize(None)
-                current_date = pd.to_datetime(datetime.now()).tz_localize(None)
+            if self.analyzer.sprint_start is not None:
+                start_date = self.analyzer.sprint_start.replace(tzinfo=None)
+                end_date = self.analyzer.sprint_end.replace(tzinfo=None)
+                current_date = datetime.now()
                 
                 # Calculate sprint progress
                 total_days = (end_date - start_date).days
@@ -425,30 +754,27 @@ class SprintDashboard:
         with col2:
             # Velocity and completion metrics
             if velocity_data:
-                completion_rate = velocity_data.get('completion_rate', 0)
-                velocity_per_day = velocity_data.get('velocity_per_day', 0)
-                
                 st.info(f"""
                 ⚡ **Velocity:** {velocity_per_day:.1f} SP/day
                 
-                ✅ **Completion Rate:** {completion_rate:.1f}%
+                ✅ **Completion Rate:** {velocity_completion_rate:.1f}%
                 
-                🎯 **Planned SP:** {velocity_data.get('planned_story_points', 0)}
+                🎯 **Planned SP:** {planned_sp}
                 
-                ✨ **Completed SP:** {velocity_data.get('completed_story_points', 0)}
+                ✨ **Completed SP:** {completed_sp}
                 """)
         
         with col3:
             # Team and work item metrics
             total_assignees = len(assignee_workload) if not assignee_workload.empty else 0
-            avg_items_per_person = summary_data.get('total_items', 0) / total_assignees if total_assignees > 0 else 0
+            avg_items_per_person = total_items / total_assignees if total_assignees > 0 else 0
             
             st.info(f"""
             👥 **Team Size:** {total_assignees} members
             
             📋 **Avg Items/Person:** {avg_items_per_person:.1f}
             
-            🔄 **In Progress:** {summary_data.get('in_progress_items', 0)} items
+            🔄 **In Progress:** {in_progress_items} items
             
             📊 **Work Item Types:** {len(type_distribution)} types
             """)
@@ -456,7 +782,7 @@ class SprintDashboard:
         # Important Work Done Section
         st.subheader("🎯 Important Work Completed")
         
-        important_work = self.analyzer.get_important_work_analysis()
+        important_work = self.get_analysis('get_important_work_analysis')
         
         if important_work and important_work.get('achievements'):
             # Display key achievements in columns
@@ -470,8 +796,8 @@ class SprintDashboard:
                         f"{achievement['story_points']:.0f} SP"
                     )
             
-            # Detailed work breakdown
-            with st.expander("📋 Detailed Work Breakdown", expanded=False):
+            # Detailed work breakdown - the tables are only built while the toggle is on
+            if st.toggle("📋 Detailed Work Breakdown", value=False, key="show_work_breakdown"):
                 for achievement in important_work['achievements']:
                     st.markdown(f"### {achievement['type']}")
                     
@@ -481,12 +807,7 @@ class SprintDashboard:
                             work_df,
                             use_container_width=True,
                             hide_index=True,
-                            column_config={
-                                "title": st.column_config.TextColumn("Work Item", width="large"),
-                                "work_item_type": st.column_config.TextColumn("Type", width="small"),
-                                "assigned_to": st.column_config.TextColumn("Assignee", width="medium"),
-                                "story_points": st.column_config.NumberColumn("SP", width="small")
-                            }
+                            column_config=ACHIEVEMENT_COLUMN_CONFIG
                         )
                     st.divider()
         else:
@@ -495,7 +816,7 @@ class SprintDashboard:
         # Sprint Champion Section
         st.subheader("🏆 Sprint Champion")
         
-        champion_analysis = self.analyzer.get_sprint_champion_analysis()
+        champion_analysis = self.get_analysis('get_sprint_champion_analysis')
         
         if champion_analysis and champion_analysis.get('champion'):
             champion = champion_analysis['champion']
@@ -503,19 +824,10 @@ class SprintDashboard:
             team_avg = champion_analysis['team_average']
             
             # Champion Header Card
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, #FFD700 0%, #FFA500 100%);
-                padding: 20px;
-                border-radius: 10px;
-                margin-bottom: 20px;
-                text-align: center;
-                border: 2px solid #FFD700;
-            ">
-                <h2 style="color: #2E2E2E; margin: 0; font-size: 2em;">🥇 {champion['assignee']}</h2>
-                <p style="color: #4A4A4A; margin: 5px 0 0 0; font-size: 1.2em; font-weight: bold;">Sprint Champion - Score: {champion['score']:.1f} points</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(
+                CHAMPION_CARD_HTML.format(assignee=html.escape(champion['assignee']), score=champion['score']),
+                unsafe_allow_html=True
+            )
             
             # Champion Key Metrics
             st.markdown("#### 📊 Champion Performance")
@@ -536,7 +848,6 @@ class SprintDashboard:
                 )
             
             with metric_col3:
-                total_completed_sp = summary_data.get('completed_story_points', 0)
                 contribution_pct = (champion['completed_story_points'] / total_completed_sp * 100) if total_completed_sp > 0 else 0
                 st.metric(
                     "Sprint Contribution",
@@ -583,11 +894,7 @@ class SprintDashboard:
                         sample_df,
                         use_container_width=True,
                         hide_index=True,
-                        column_config={
-                            "title": st.column_config.TextColumn("Work Item", width="large"),
-                            "work_item_type": st.column_config.TextColumn("Type", width="small"),
-                            "story_points": st.column_config.NumberColumn("SP", width="small")
-                        }
+                        column_config=CHAMPION_WORK_COLUMN_CONFIG
                     )
                 else:
                     st.markdown("#### 🏆 Champion Recognition")
@@ -614,14 +921,7 @@ class SprintDashboard:
                     leaderboard_df,
                     use_container_width=True,
                     hide_index=True,
-                    column_config={
-                        "🏆": st.column_config.NumberColumn("Rank", width="small"),
-                        "Name": st.column_config.TextColumn("Contributor", width="medium"),
-                        "Score": st.column_config.TextColumn("Score", width="small"),
-                        "Completion": st.column_config.TextColumn("Completion", width="small"),
-                        "Story Points": st.column_config.TextColumn("Completed SP", width="small"),
-                        "High Priority": st.column_config.NumberColumn("Priority Items", width="small")
-                    }
+                    column_config=LEADERBOARD_COLUMN_CONFIG
                 )
         else:
             st.info("🏆 No champion data available - need team members with significant work completed")
@@ -633,18 +933,16 @@ class SprintDashboard:
         
         with health_col1:
             # Completion health
-            completion_rate = summary_data.get('completion_percentage', 0)
-            if completion_rate >= 80:
-                st.success(f"✅ **Completion:** {completion_rate:.1f}%\nExcellent progress!")
-            elif completion_rate >= 60:
-                st.warning(f"⚠️ **Completion:** {completion_rate:.1f}%\nOn track")
+            if completion_percentage >= 80:
+                st.success(f"✅ **Completion:** {completion_percentage:.1f}%\nExcellent progress!")
+            elif completion_percentage >= 60:
+                st.warning(f"⚠️ **Completion:** {completion_percentage:.1f}%\nOn track")
             else:
-                st.error(f"🚨 **Completion:** {completion_rate:.1f}%\nNeeds attention")
+                st.error(f"🚨 **Completion:** {completion_percentage:.1f}%\nNeeds attention")
         
         with health_col2:
             # Velocity health
             if velocity_data:
-                velocity_per_day = velocity_data.get('velocity_per_day', 0)
                 if velocity_per_day >= 2:
                     st.success(f"🚀 **Velocity:** {velocity_per_day:.1f} SP/day\nHigh velocity")
                 elif velocity_per_day >= 1:
@@ -655,8 +953,9 @@ class SprintDashboard:
         with health_col3:
             # Team balance health
             if not assignee_workload.empty:
-                workload_std = assignee_workload['story_points'].std()
-                workload_mean = assignee_workload['story_points'].mean()
+                story_points = assignee_workload['story_points'].to_numpy(dtype=float)
+                workload_mean = story_points.mean()
+                workload_std = story_points.std(ddof=1) if story_points.size > 1 else 0.0
                 balance_ratio = workload_std / workload_mean if workload_mean > 0 else 0
                 
                 if balance_ratio <= 0.3:
@@ -668,7 +967,7 @@ class SprintDashboard:
         
         with health_col4:
             # Blocked items health
-            blocked_items = self.analyzer.get_blocked_items()
+            blocked_items = self.get_analysis('get_blocked_items')
             blocked_count = len(blocked_items) if not blocked_items.empty else 0
             
             if blocked_count == 0:
@@ -683,42 +982,43 @@ class SprintDashboard:
         st.header("🔥 Burndown Analysis")
         
         # Get daily progress data
-        daily_progress = self.analyzer.get_daily_progress()
+        daily_progress = self.get_analysis('get_daily_progress')
         
         col1, col2 = st.columns([2, 1])
         
         with col1:
             # Burndown chart
-            burndown_fig = self.viz.create_burndown_chart(daily_progress)
+            burndown_fig = self.get_figure('create_burndown_chart', daily_progress)
             st.plotly_chart(burndown_fig, use_container_width=True)
         
         with col2:
             # Velocity metrics
-            velocity_data = self.analyzer.get_velocity_data()
-            velocity_fig = self.viz.create_velocity_chart(velocity_data)
+            velocity_data = self.get_analysis('get_velocity_data')
+            velocity_fig = self.get_figure('create_velocity_chart', velocity_data)
             st.plotly_chart(velocity_fig, use_container_width=True)
     
     def display_work_item_analysis(self):
         """Display work item analysis section"""
+        summary_data = self.summary_data
+        
         st.header("📋 Work Item Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Work item type distribution
-            type_dist = self.analyzer.get_work_item_type_distribution()
-            type_fig = self.viz.create_work_item_type_chart(type_dist)
+            type_dist = self.get_analysis('get_work_item_type_distribution')
+            type_fig = self.get_figure('create_work_item_type_chart', type_dist)
             st.plotly_chart(type_fig, use_container_width=True)
         
         with col2:
             # State distribution
-            summary_data = self.analyzer.get_sprint_summary()
-            state_fig = self.viz.create_state_distribution_chart(summary_data.get('state_distribution', {}))
+            state_fig = self.get_figure('create_state_distribution_chart', summary_data.get('state_distribution', {}))
             st.plotly_chart(state_fig, use_container_width=True)
         
         # Priority distribution
-        priority_data = self.analyzer.get_priority_distribution()
-        priority_fig = self.viz.create_priority_distribution_chart(priority_data)
+        priority_data = self.get_analysis('get_priority_distribution')
+        priority_fig = self.get_figure('create_priority_distribution_chart', priority_data)
         st.plotly_chart(priority_fig, use_container_width=True)
     
     def display_team_analysis(self):
@@ -726,8 +1026,8 @@ class SprintDashboard:
         st.header("👥 Team Analysis")
         
         # Assignee workload
-        assignee_workload = self.analyzer.get_assignee_workload()
-        workload_fig = self.viz.create_assignee_workload_chart(assignee_workload)
+        assignee_workload = self.get_analysis('get_assignee_workload')
+        workload_fig = self.get_figure('create_assignee_workload_chart', assignee_workload)
         st.plotly_chart(workload_fig, use_container_width=True)
         
         # Detailed workload table
@@ -737,14 +1037,7 @@ class SprintDashboard:
                 assignee_workload,
                 use_container_width=True,
                 hide_index=True,
-                column_config={
-                    "assigned_to": st.column_config.TextColumn("Assignee", width="medium"),
-                    "total_items": st.column_config.NumberColumn("Total Items", width="small"),
-                    "story_points": st.column_config.NumberColumn("Story Points", width="small"),
-                    "completed_items": st.column_config.NumberColumn("Completed", width="small"),
-                    "completed_story_points": st.column_config.NumberColumn("Completed SP", width="small"),
-                    "completion_rate": st.column_config.NumberColumn("Completion %", width="small", format="%.1f%%")
-                }
+                column_config=WORKLOAD_COLUMN_CONFIG
             )
     
     def display_quality_metrics(self):
@@ -755,13 +1048,13 @@ class SprintDashboard:
         
         with col1:
             # Cycle time analysis
-            cycle_time_data = self.analyzer.get_cycle_time_analysis()
-            cycle_time_fig = self.viz.create_cycle_time_chart(cycle_time_data)
+            cycle_time_data = self.get_analysis('get_cycle_time_analysis')
+            cycle_time_fig = self.get_figure('create_cycle_time_chart', cycle_time_data)
             st.plotly_chart(cycle_time_fig, use_container_width=True)
         
         with col2:
             # Blocked items
-            blocked_items = self.analyzer.get_blocked_items()
+            blocked_items = self.get_analysis('get_blocked_items')
             self.viz.display_blocked_items_table(blocked_items)
         
         # Cycle time details table
@@ -771,55 +1064,58 @@ class SprintDashboard:
                 cycle_time_data,
                 use_container_width=True,
                 hide_index=True,
-                column_config={
-                    "work_item_type": st.column_config.TextColumn("Work Item Type", width="medium"),
-                    "count": st.column_config.NumberColumn("Count", width="small"),
-                    "avg_cycle_time": st.column_config.NumberColumn("Avg Days", width="small", format="%.1f"),
-                    "median_cycle_time": st.column_config.NumberColumn("Median Days", width="small", format="%.1f"),
-                    "min_cycle_time": st.column_config.NumberColumn("Min Days", width="small"),
-                    "max_cycle_time": st.column_config.NumberColumn("Max Days", width="small")
-                }
+                column_config=CYCLE_TIME_COLUMN_CONFIG
             )
     
     def display_raw_data_tab(self):
         """Display raw data in tab format"""
         st.header("🔍 Raw Data")
         
-        if self.analyzer and not self.analyzer.df.empty:
+        df = self.analyzer.df if self.analyzer else None
+        if df is not None and not df.empty:
             st.subheader("Work Items Data")
             
+            total_rows = len(df)
+            
             # Display data summary
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Total Work Items", len(self.analyzer.df))
+                st.metric("Total Work Items", total_rows)
             with col2:
-                st.metric("Columns", len(self.analyzer.df.columns))
+                st.metric("Columns", len(df.columns))
             with col3:
                 # Download button
-                csv = self.analyzer.df.to_csv(index=False)
+                csv = _csv_bytes(self.data_key, df)
                 st.download_button(
                     label="📥 Download CSV",
                     data=csv,
-                    file_name=f"sprint_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    file_name=f"sprint_data_{self.fetched_at.strftime('%Y%m%d_%H%M%S')}.csv",
                     mime="text/csv"
                 )
             
             st.divider()
             
-            # Display the dataframe
+            # Display the dataframe one page at a time to limit the payload sent to the browser
+            page_count = (total_rows - 1) // RAW_DATA_PAGE_SIZE + 1
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+            start_row = (page - 1) * RAW_DATA_PAGE_SIZE
+            end_row = min(start_row + RAW_DATA_PAGE_SIZE, total_rows)
+            
             st.dataframe(
-                self.analyzer.df,
+                df.iloc[start_row:end_row],
                 use_container_width=True,
                 hide_index=True
             )
+            st.caption(f"Showing rows {start_row + 1}-{end_row} of {total_rows}")
             
             # Data info
             with st.expander("📊 Data Information", expanded=False):
                 st.write("**Column Information:**")
-                for col in self.analyzer.df.columns:
-                    non_null_count = self.analyzer.df[col].count()
-                    total_count = len(self.analyzer.df)
-                    st.write(f"- **{col}**: {non_null_count}/{total_count} non-null values")
+                non_null_counts = df.notna().sum()
+                st.markdown("\n".join(
+                    f"- **{col}**: {non_null_count}/{total_rows} non-null values"
+                    for col, non_null_count in non_null_counts.items()
+                ))
         else:
             st.warning("No data available to display.")
     
@@ -844,9 +1140,8 @@ class SprintDashboard:
         
         # Check if data should be loaded
         should_load_data = (
-            hasattr(st.session_state, 'fetch_data_clicked') and 
-            st.session_state.fetch_data_clicked and
-            config['selected_sprint'] != "Select a sprint..." and
+            st.session_state.get('fetch_data_clicked') and
+            config['selected_sprint'] and
             config['area_path']
         )
         
@@ -854,47 +1149,53 @@ class SprintDashboard:
             # Reset the flag
             st.session_state.fetch_data_clicked = False
             
-            # Load data with new configuration
-            if self.load_data_with_config(config):
-                st.session_state.data_loaded = True
-                st.session_state.current_config = config
-            else:
-                st.session_state.data_loaded = False
-                return
+            # Load data with new configuration, reusing it when the same selection is already loaded
+            if not self.analyzer or config != st.session_state.get('current_config'):
+                if self.load_data_with_config(config):
+                    st.session_state.data_loaded = True
+                    st.session_state.current_config = config
+                    st.session_state.analyzer = self.analyzer
+                    st.session_state.data_key = self.data_key
+                    st.session_state.data_fetched_at = self.fetched_at
+                else:
+                    # Forget the previous selection so fetching it again reloads instead of being skipped
+                    st.session_state.data_loaded = False
+                    st.session_state.current_config = None
+                    st.session_state.analyzer = None
+                    st.session_state.data_key = None
+                    return
         
         # Check if data is loaded and display dashboard
-        if hasattr(st.session_state, 'data_loaded') and st.session_state.data_loaded and self.analyzer:
-            # Create tabs for different sections
-            tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-                "📈 Sprint Overview", 
-                "🔥 Burndown Analysis", 
-                "📋 Work Items", 
-                "👥 Team Analysis", 
-                "📊 Quality Metrics", 
-                "🔍 Raw Data"
-            ])
-            
-            with tab1:
-                self.display_sprint_overview()
-            
-            with tab2:
-                self.display_burndown_analysis()
+        if st.session_state.get('data_loaded') and self.analyzer:
+            # Precompute all analyzer metrics once before rendering
+            self.metrics = _compute_sprint_metrics(self.data_key, self.analyzer)
+            self.summary_data = self.get_analysis('get_sprint_summary')
             
-            with tab3:
-                self.display_work_item_analysis()
-            
-            with tab4:
-                self.display_team_analysis()
+            # Only the selected section is rendered, unlike st.tabs which runs every tab body
+            sections = {
+                "📈 Sprint Overview": self.display_sprint_overview,
+                "🔥 Burndown Analysis": self.display_burndown_analysis,
+                "📋 Work Items": self.display_work_item_analysis,
+                "👥 Team Analysis": self.display_team_analysis,
+                "📊 Quality Metrics": self.display_quality_metrics,
+                "🔍 Raw Data": self.display_raw_data_tab
+            }
             
-            with tab5:
-                self.display_quality_metrics()
+            active_section = st.radio(
+                "Section",
+                options=list(sections.keys()),
+                horizontal=True,
+                label_visibility="collapsed",
+                key="active_section"
+            )
             
-            with tab6:
-                self.display_raw_data_tab()
+            # Run the section as a fragment so widgets inside it only rerun that section
+            st.fragment(sections[active_section])()
             
             # Footer
             st.markdown("---")
-            st.markdown("*Dashboard last updated: " + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + "*")
+            # Stamped with the fetch time carried in the cached result, not when this session loaded it
+            st.markdown("*Dashboard last updated: " + self.fetched_at.strftime('%Y-%m-%d %H:%M:%S') + "*")
         
         else:
             # Show instructions when no data is loaded
@@ -913,18 +1214,23 @@ class SprintDashboard:
             with st.expander("🔍 Current Configuration Status", expanded=True):
                 col1, col2 = st.columns(2)
                 
+                # Each column is emitted as a single markdown element
                 with col1:
-                    st.write("**Azure DevOps Settings:**")
-                    st.write(f"✅ Organization: {config['organization']}" if config['organization'] else "❌ Organization: Not set")
-                    st.write(f"✅ Project: {config['project']}" if config['project'] else "❌ Project: Not set")
-                    st.write(f"✅ Team: {config['team']}" if config['team'] else "❌ Team: Not set")
-                    st.write(f"✅ PAT: {'Set' if config['pat'] else 'Not set'}")
+                    st.markdown("  \n".join([
+                        "**Azure DevOps Settings:**",
+                        f"✅ Organization: {config['organization']}" if config['organization'] else "❌ Organization: Not set",
+                        f"✅ Project: {config['project']}" if config['project'] else "❌ Project: Not set",
+                        f"✅ Team: {config['team']}" if config['team'] else "❌ Team: Not set",
+                        f"✅ PAT: {'Set' if config['pat'] else 'Not set'}"
+                    ]))
                 
                 with col2:
-                    st.write("**Data Configuration:**")
-                    st.write(f"✅ Sprints Loaded: {len(st.session_state.get('available_iterations', []))}")
-                    st.write(f"✅ Sprint Selected: {config['selected_sprint']}" if config['selected_sprint'] != "Select a sprint..." else "❌ Sprint: Not selected")
-                    st.write(f"✅ Area Path: {config['area_path']}" if config['area_path'] else "❌ Area Path: Not set")
+                    st.markdown("  \n".join([
+                        "**Data Configuration:**",
+                        f"✅ Sprints Loaded: {len(st.session_state.get('available_iterations', []))}",
+                        f"✅ Sprint Selected: {config['selected_sprint']}" if config['selected_sprint'] else "❌ Sprint: Not selected",
+                        f"✅ Area Path: {config['area_path']}" if config['area_path'] else "❌ Area Path: Not set"
+                    ]))
 
 
 def main():
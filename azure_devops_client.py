@@ -7,6 +7,7 @@ import pandas as pd
 from datetime import datetime, timedelta
 import base64
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import streamlit as st
 from config import AZURE_DEVOPS_CONFIG, API_ENDPOINTS
@@ -134,6 +135,29 @@ class AzureDevOpsClient:
             st.error(f"Failed to fetch work items: {str(e)}")
             return []
     
+    def _fetch_work_items_batch(self, batch_ids: List[int]) -> List[Dict]:
+        """
+        Fetch one batch of work items with the workitemsbatch endpoint
+        
+        Args:
+            batch_ids: Work item IDs in this batch (at most 200)
+            
+        Returns:
+            List of work item dictionaries
+        """
+        # Use POST request for batch operations to avoid URI length limits
+        url = API_ENDPOINTS['work_items_batch'].format(**self.config)
+        params = {'api-version': self.config['api_version']}
+        
+        payload = {
+            'ids': batch_ids,
+            '$expand': 'all'
+        }
+        
+        response = self.session.post(url, json=payload, params=params)
+        response.raise_for_status()
+        return response.json().get('value', [])
+    
     def get_work_items_details(self, work_item_ids: List[int]) -> List[Dict]:
         """
         Get detailed information for work items
@@ -143,34 +167,24 @@ class AzureDevOpsClient:
             
         Returns:
             List of detailed work item dictionaries
+            
+        Raises:
+            requests.exceptions.RequestException: If any batch fails, so callers never get a partial list
         """
         if not work_item_ids:
             return []
         
-        # Split large requests into smaller batches to avoid URI length limits
-        batch_size = 100  # Azure DevOps supports up to 200, but we'll use 100 for safety
+        # Split large requests into batches of the API maximum and fetch them concurrently
+        batch_size = 200
+        batches = [work_item_ids[i:i + batch_size] for i in range(0, len(work_item_ids), batch_size)]
         all_work_items = []
         
-        for i in range(0, len(work_item_ids), batch_size):
-            batch_ids = work_item_ids[i:i + batch_size]
-            
-            # Use POST request for batch operations to avoid URI length limits
-            url = API_ENDPOINTS['work_items_batch'].format(**self.config)
-            params = {'api-version': self.config['api_version']}
-            
-            payload = {
-                'ids': batch_ids,
-                '$expand': 'all'
-            }
+        with ThreadPoolExecutor(max_workers=min(len(batches), 4)) as executor:
+            futures = [executor.submit(self._fetch_work_items_batch, batch_ids) for batch_ids in batches]
             
-            try:
-                response = self.session.post(url, json=payload, params=params)
-                response.raise_for_status()
-                batch_result = response.json()
-                all_work_items.extend(batch_result.get('value', []))
-            except requests.exceptions.RequestException as e:
-                st.error(f"Failed to fetch work item batch: {str(e)}")
-                continue
+            # Collect in submission order so results keep the WIQL ordering
+            for future in futures:
+                all_work_items.extend(future.result())
         
         return all_work_items
     
@@ -22,8 +22,22 @@ class SprintAnalyzer:
         """
         self.work_items = work_items
         self.iteration_info = iteration_info
+        self.sprint_start, self.sprint_end = self._parse_sprint_dates()
         self.df = self._create_dataframe()
     
+    def _parse_sprint_dates(self) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        """
+        Parse the sprint start and finish dates once for all metrics
+        
+        Returns:
+            Tuple of (start, finish) timestamps, or (None, None) if the sprint is unscheduled
+        """
+        attributes = (self.iteration_info or {}).get('attributes', {})
+        if not attributes.get('startDate') or not attributes.get('finishDate'):
+            return None, None
+        
+        return pd.to_datetime(attributes['startDate']), pd.to_datetime(attributes['finishDate'])
+    
     def _create_dataframe(self) -> pd.DataFrame:
         """
         Create a pandas DataFrame from work items
@@ -48,8 +62,8 @@ class SprintAnalyzer:
                 'work_item_type': fields.get('System.WorkItemType', ''),
                 'state': fields.get('System.State', ''),
                 'assigned_to': assignee,
-                'created_date': pd.to_datetime(fields.get('System.CreatedDate', '')),
-                'changed_date': pd.to_datetime(fields.get('System.ChangedDate', '')),
+                'created_date': fields.get('System.CreatedDate', ''),
+                'changed_date': fields.get('System.ChangedDate', ''),
                 'story_points': fields.get('Microsoft.VSTS.Scheduling.StoryPoints', 0) or 0,
                 'priority': fields.get('Microsoft.VSTS.Common.Priority', 2),
                 'tags': fields.get('System.Tags', ''),
@@ -57,7 +71,18 @@ class SprintAnalyzer:
                 'iteration_path': fields.get('System.IterationPath', '')
             })
         
-        return pd.DataFrame(data)
+        df = pd.DataFrame(data)
+        
+        # Parse dates column-wise rather than one scalar at a time per work item
+        for col in ['created_date', 'changed_date']:
+            df[col] = pd.to_datetime(df[col], format='ISO8601')
+        
+        # Low-cardinality string columns are grouped and filtered repeatedly; categorical
+        # codes make those operations work on integers instead of Python strings
+        for col in ['work_item_type', 'state', 'assigned_to']:
+            df[col] = df[col].astype('category')
+        
+        return df
     
     def get_sprint_summary(self) -> Dict:
         """
@@ -110,7 +135,7 @@ class SprintAnalyzer:
         if self.df.empty:
             return pd.DataFrame()
         
-        type_dist = self.df.groupby('work_item_type').agg({
+        type_dist = self.df.groupby('work_item_type', observed=True).agg({
             'id': 'count',
             'story_points': 'sum'
         }).rename(columns={'id': 'count'}).reset_index()
@@ -127,14 +152,14 @@ class SprintAnalyzer:
         if self.df.empty:
             return pd.DataFrame()
         
-        assignee_workload = self.df.groupby('assigned_to').agg({
+        assignee_workload = self.df.groupby('assigned_to', observed=True).agg({
             'id': 'count',
             'story_points': 'sum'
         }).rename(columns={'id': 'total_items'}).reset_index()
         
         # Add completion data
         completed_states = ['Done', 'Closed', 'Resolved']
-        completed_by_assignee = self.df[self.df['state'].isin(completed_states)].groupby('assigned_to').agg({
+        completed_by_assignee = self.df[self.df['state'].isin(completed_states)].groupby('assigned_to', observed=True).agg({
             'id': 'count',
             'story_points': 'sum'
         }).rename(columns={'id': 'completed_items', 'story_points': 'completed_story_points'})
@@ -180,38 +205,28 @@ class SprintAnalyzer:
         Returns:
             DataFrame with daily progress data
         """
-        if self.df.empty or not self.iteration_info:
+        if self.df.empty or self.sprint_start is None:
             return pd.DataFrame()
         
-        # Get sprint date range
-        start_date = pd.to_datetime(self.iteration_info['attributes']['startDate'])
-        end_date = pd.to_datetime(self.iteration_info['attributes']['finishDate'])
-        
         # Create date range
-        date_range = pd.date_range(start=start_date, end=end_date, freq='D')
+        date_range = pd.date_range(start=self.sprint_start, end=self.sprint_end, freq='D')
         
         # Calculate remaining work for each day
-        daily_data = []
         total_story_points = self.df['story_points'].sum()
         
-        for date in date_range:
-            # Items completed by this date
-            completed_items = self.df[
-                (self.df['changed_date'] <= date) & 
-                (self.df['state'].isin(['Done', 'Closed', 'Resolved']))
-            ]
-            
-            completed_points = completed_items['story_points'].sum()
-            remaining_points = total_story_points - completed_points
-            
-            daily_data.append({
-                'date': date,
-                'remaining_story_points': remaining_points,
-                'completed_story_points': completed_points,
-                'total_story_points': total_story_points
-            })
+        # Running total of completed points ordered by completion date, looked up per day
+        completed_items = self.df[
+            self.df['state'].isin(['Done', 'Closed', 'Resolved'])
+        ].dropna(subset=['changed_date']).sort_values('changed_date')
+        cumulative_points = np.concatenate(([0], completed_items['story_points'].cumsum().to_numpy()))
+        completed_points = cumulative_points[completed_items['changed_date'].searchsorted(date_range, side='right')]
         
-        return pd.DataFrame(daily_data)
+        return pd.DataFrame({
+            'date': date_range,
+            'remaining_story_points': total_story_points - completed_points,
+            'completed_story_points': completed_points,
+            'total_story_points': total_story_points
+        })
     
     def get_velocity_data(self) -> Dict:
         """
@@ -220,13 +235,11 @@ class SprintAnalyzer:
         Returns:
             Dictionary with velocity data
         """
-        if self.df.empty or not self.iteration_info:
+        if self.df.empty or self.sprint_start is None:
             return {}
         
         # Sprint duration in days
-        start_date = pd.to_datetime(self.iteration_info['attributes']['startDate'])
-        end_date = pd.to_datetime(self.iteration_info['attributes']['finishDate'])
-        sprint_duration = (end_date - start_date).days
+        sprint_duration = (self.sprint_end - self.sprint_start).days
         
         # Completed story points
         completed_states = ['Done', 'Closed', 'Resolved']
@@ -268,7 +281,7 @@ class SprintAnalyzer:
         ).dt.days
         
         # Group by work item type
-        cycle_time_analysis = completed_items.groupby('work_item_type')['cycle_time_days'].agg([
+        cycle_time_analysis = completed_items.groupby('work_item_type', observed=True)['cycle_time_days'].agg([
             'count', 'mean', 'median', 'std', 'min', 'max'
         ]).round(2)
         
@@ -333,7 +346,7 @@ class SprintAnalyzer:
         significant_work = completed_items[completed_items['story_points'] >= 5]
         
         # Work by type
-        work_by_type = completed_items.groupby('work_item_type').agg({
+        work_by_type = completed_items.groupby('work_item_type', observed=True).agg({
             'id': 'count',
             'story_points': 'sum',
             'title': lambda x: list(x)[:5]  # Top 5 titles per type
@@ -441,8 +454,9 @@ class SprintAnalyzer:
                 bug_fixes * 2  # 2 points per bug fix
             )
             
-            # Work quality analysis
-            work_types = completed_work['work_item_type'].value_counts().to_dict()
+            # Work quality analysis (categorical value_counts also lists types with no items)
+            work_types = completed_work['work_item_type'].value_counts()
+            work_types = work_types[work_types > 0].to_dict()
             sample_work = completed_work[['title', 'work_item_type', 'story_points', 'priority']].to_dict('records')[:5]
             
             champion_scores.append({
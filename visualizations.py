@@ -10,6 +10,16 @@ import streamlit as st
 from typing import Dict, List
 from config import CHART_COLORS, WORK_ITEM_TYPES, WORK_ITEM_STATES, PASTEL_PALETTE
 
+# Column configuration for the blocked items table
+BLOCKED_ITEMS_COLUMN_CONFIG = {
+    "id": st.column_config.NumberColumn("ID", width="small"),
+    "title": st.column_config.TextColumn("Title", width="large"),
+    "work_item_type": st.column_config.TextColumn("Type", width="medium"),
+    "state": st.column_config.TextColumn("State", width="medium"),
+    "assigned_to": st.column_config.TextColumn("Assignee", width="medium"),
+    "days_since_update": st.column_config.NumberColumn("Days Since Update", width="small")
+}
+
 
 class DashboardVisualizations:
     """Class for creating dashboard visualizations"""
@@ -497,12 +507,5 @@ class DashboardVisualizations:
             display_df,
             use_container_width=True,
             hide_index=True,
-            column_config={
-                "id": st.column_config.NumberColumn("ID", width="small"),
-                "title": st.column_config.TextColumn("Title", width="large"),
-                "work_item_type": st.column_config.TextColumn("Type", width="medium"),
-                "state": st.column_config.TextColumn("State", width="medium"),
-                "assigned_to": st.column_config.TextColumn("Assignee", width="medium"),
-                "days_since_update": st.column_config.NumberColumn("Days Since Update", width="small")
-            }
+            column_config=BLOCKED_ITEMS_COLUMN_CONFIG
         )